@@ -11,37 +11,41 @@ def _normalize(_rgb: tuple[float, float, float]) -> str:
 
 
 def _get_colorbox(width: int) -> str:
-    _buff = ""
+    _parts: list[str] = []
 
-    for y_pos in range(0, 5):
-        for x_pos in range(width):
-            # Mmmm, spiky code
-            _hue = x_pos / width
-            _lightness = 0.1 + ((y_pos / 5) * 0.7)
+    # The hues & lightnesses only depend on one axis each, so we only compute them once
+    _hues = [x_pos / width for x_pos in range(width)]
+    _lightnesses = [0.1 + ((y_pos / 5) * 0.7) for y_pos in range(0, 5)]
+
+    for _lightness in _lightnesses:
+        for _hue in _hues:
             _rgb1 = colorsys.hls_to_rgb(_hue, _lightness, 1.0)
             _rgb2 = colorsys.hls_to_rgb(_hue, _lightness + 0.07, 1.0)
 
             _bg_color = ";".join(_normalize(_rgb1))
             _color = ";".join(_normalize(_rgb2))
-            _buff += f"[{_bg_color} @{_color}]▀"
+            _parts.append(f"[{_bg_color} @{_color}]▀")
 
-        _buff += "\n"
+        _parts.append("\n")
 
-    return _buff
+    return "".join(_parts)
 
 
 def _draw_colorbox(markup: str) -> None:
-    for line in markup.splitlines():
-        for span in zml_get_spans(line):
-            terminal.write(span)
+    # Parse the whole box at once, and move to the next row on every newline
+    for span in zml_get_spans(markup):
+        *lines, last = span.split("\n")
+
+        for line in lines:
+            terminal.write(line)
+            terminal.cursor = 0, terminal.cursor[1] + 1
 
-        terminal.cursor = 0, terminal.cursor[1] + 1
+        if last.text != "":
+            terminal.write(last)
 
     terminal.draw()
     terminal.cursor = 0, terminal.cursor[1] + 1
 
-    zml_get_spans.cache_clear()
-
 
 markup = _get_colorbox(50)
 
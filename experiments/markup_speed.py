@@ -1,23 +1,53 @@
-from timeit import timeit
+from timeit import repeat
 
 from zenith import zml
+from zenith.markup import (
+    clear_caches,
+    combine_spans,
+    zml_get_spans,
+    zml_pre_process,
+)
 
 EXEC_COUNT = 1000
+REPEAT_COUNT = 5
+
+MARKUP = "[bold 141]Hello [/fg @61]There"
+
+
+def _time(statement: str) -> float:
+    """Returns the best time per execution of the given statement, in nanoseconds."""
+
+    timings = repeat(
+        statement, globals=globals(), number=EXEC_COUNT, repeat=REPEAT_COUNT
+    )
+
+    return min(timings) * float("1e+9") / EXEC_COUNT
 
 
 def main() -> None:
+    # Pre-processing only depends on the markup & context, so it can be done once
+    # outside of the timing loop to show the cost of the remaining stages.
+    processed = zml_pre_process(MARKUP)
+
     print(
         "Input: "
         + zml("[@black grey] ").removesuffix(" \x1b[0m")
-        + "[bold 141]Hello [/fg @61]There\n"
-        + "\x1b[0m",
-        timeit(
-            'zml("[bold 141]Hello [/fg @61]There")',
-            globals=globals(),
-            number=EXEC_COUNT,
-        )
-        * float("1e+9")
-        / EXEC_COUNT,
+        + MARKUP
+        + "\n"
+        + "\x1b[0m"
+    )
+
+    # Uncached timings include clearing the caches, which is cheap next to parsing.
+    print("Uncached:", _time("clear_caches(); zml(MARKUP)"))
+    print("Cached:", _time("zml(MARKUP)"))
+
+    print(
+        "Pre-processed, uncached:",
+        _time(f"clear_caches(); combine_spans(zml_get_spans({processed!r}))"),
+    )
+    print(
+        "Pre-processed, cached:",
+        _time(f"combine_spans(zml_get_spans({processed!r}))"),
     )
 
 
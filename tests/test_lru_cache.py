@@ -0,0 +1,51 @@
+import pytest
+
+from zenith.lru_cache import LRUCache
+
+
+def test_lru_cache_eviction():
+    cache = LRUCache(maxsize=2)
+
+    cache["a"] = 1
+    cache["b"] = 2
+    cache["c"] = 3
+
+    assert len(cache) == 2
+    assert "a" not in cache
+    assert cache["b"] == 2
+    assert cache["c"] == 3
+
+
+def test_lru_cache_recency():
+    cache = LRUCache(maxsize=2)
+
+    cache["a"] = 1
+    cache["b"] = 2
+
+    # Using "a" makes "b" the least recently used item
+    assert cache["a"] == 1
+
+    cache["c"] = 3
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    cache["a"] = 4
+    cache["d"] = 5
+    assert "c" not in cache
+    assert cache["a"] == 4
+
+
+def test_lru_cache_errors():
+    cache = LRUCache()
+
+    with pytest.raises(KeyError):
+        cache["missing"]
+
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
+
+    cache["key"] = "value"
+    cache.clear()
+
+    assert len(cache) == 0
@@ -3,7 +3,15 @@ import pytest
 
 from slate import terminal, ColorSpace, Color
 from zenith import zml, zml_alias, zml_macro, ZmlNameError, ZmlSemanticsError
-from zenith.markup import parse_color
+from zenith.markup import (
+    parse_color,
+    zml_context,
+    zml_get_spans,
+    zml_macro_setter,
+    zml_pre_process,
+    zml_refresh,
+    zml_unalias,
+)
 
 
 def test_markup_builtin_only():
@@ -13,12 +21,22 @@ def test_markup_builtin_only():
 
     assert (
         result := zml("[bold 141]Hello [/bold @61]There ")
-    ) == "\x1b[38;5;141;1mHello \x1b[22m\x1b[48;5;61mThere ", repr(result)
+    ) == "\x1b[38;5;141;1mHello \x1b[22;48;5;61mThere ", repr(result)
 
     assert (
         result := zml("[bold 141]Hello [/]There ")
     ) == "\x1b[38;5;141;1mHello \x1b[0mThere ", repr(result)
 
+    assert (
+        result := zml(
+            "[strike conceal fast_blink]Hello [/strike /conceal /fast_blink]There"
+        )
+    ) == "\x1b[6;8;9mHello \x1b[25;28;29mThere", repr(result)
+
+    assert (result := zml("[bold]a[/ /]b[/][/]c")) == (
+        "\x1b[1ma\x1b[0mb\x1b[0mc"
+    ), repr(result)
+
     assert (
         result := zml("[~https://github.com]Hello There ")
     ) == "\x1b]8;;https://github.com\x1b\\Hello There \x1b]8;;\x1b\\", repr(result)
@@ -28,6 +46,10 @@ def test_markup_builtin_only():
         + "\x1b]8;;\x1b\\\x1b[38;2;255;0;0mThere no link"
     ), repr(result)
 
+    assert (result := zml("[~https://github.com]Hello [bold /bold]There")) == (
+        "\x1b]8;;https://github.com\x1b\\Hello There\x1b]8;;\x1b\\"
+    ), repr(result)
+
     assert (
         result := zml("[127]Hello [/fg]There ")
     ) == "\x1b[38;5;127mHello \x1b[39mThere ", repr(result)
@@ -48,6 +70,18 @@ def test_markup_aliases():
         result := zml("[test]Hello[/test]Reset")
     ) == "\x1b[38;2;165;42;42;1mHello\x1b[22;39mReset", repr(result)
 
+    zml_alias(test_bg="@red italic")
+
+    assert (
+        result := zml("[test-bg]Hello[/test-bg]Reset")
+    ) == "\x1b[38;2;35;35;35;48;2;255;0;0;3mHello\x1b[23;39;49mReset", repr(result)
+
+    zml_alias({"test.mapped": "underline"})
+
+    assert (
+        result := zml("[test.mapped]Hello[/test.mapped]Reset")
+    ) == "\x1b[4mHello\x1b[24mReset", repr(result)
+
 
 def test_markup_macros():
     @zml_macro
@@ -80,6 +114,71 @@ def test_markup_macros():
     )
 
 
+def test_markup_pre_process_without_aliases():
+    plain_ctx = zml_context()
+
+    # An unused alias means nothing gets substituted, but the full pass still runs
+    aliased_ctx = zml_context()
+    zml_alias(unused="bold", ctx=aliased_ctx)
+
+    for markup in ["[bold  italic]x", "[]x", "[ bold ]x", "[bold][italic]x[/]y"]:
+        plain = zml_pre_process(markup, ctx=plain_ctx)
+        aliased = zml_pre_process(markup, ctx=aliased_ctx)
+        assert plain == aliased, (markup, plain, aliased)
+
+        plain = zml(markup, ctx=plain_ctx)
+        aliased = zml(markup, ctx=aliased_ctx)
+        assert plain == aliased, (markup, plain, aliased)
+
+
+def test_markup_cache_invalidation():
+    ctx = zml_context()
+
+    zml_alias(cached="bold", ctx=ctx)
+    assert (result := zml("[cached]Test", ctx=ctx)) == "\x1b[1mTest", repr(result)
+
+    zml_alias(cached="italic", ctx=ctx)
+    assert (result := zml("[cached]Test", ctx=ctx)) == "\x1b[3mTest", repr(result)
+    assert zml_pre_process("[cached]Test", ctx=ctx) == "[italic]Test"
+
+    zml_alias(cached="dim", ctx=ctx)
+    assert zml_pre_process("[cached]Test", ctx=ctx) == "[dim]Test"
+
+    zml_unalias("cached", ctx=ctx)
+    assert "/cached" not in ctx["aliases"]
+
+    with pytest.raises(ZmlNameError):
+        zml("[cached]Test", ctx=ctx)
+
+    calls = []
+
+    @zml_macro_setter(ctx=ctx)
+    def counter(text: str) -> str:
+        calls.append(text)
+        return text + str(len(calls))
+
+    assert zml("[!counter]Test", ctx=ctx) == "Test1"
+    assert zml("[!counter]Test", ctx=ctx) == "Test2"
+
+    # Direct edits don't update the context's version, so they need a refresh
+    zml_alias(edited="bold", ctx=ctx)
+    assert (result := zml("[edited]Test", ctx=ctx)) == "\x1b[1mTest", repr(result)
+
+    ctx["aliases"]["edited"] = "italic"
+    assert (result := zml("[edited]Test", ctx=ctx)) == "\x1b[1mTest", repr(result)
+
+    zml_refresh(ctx)
+    assert (result := zml("[edited]Test", ctx=ctx)) == "\x1b[3mTest", repr(result)
+
+
+def test_markup_alpha():
+    assert (result := zml("[red*0.5]Test")) == "\x1b[38;2;255;0;0mTest", repr(result)
+
+    assert (
+        result := zml("[@141*0.5]Test")
+    ) == "\x1b[38;2;35;35;35;48;2;175;135;255mTest", repr(result)
+
+
 def test_markup_auto_foreground():
     assert (
         result := zml("[@red]Test")
@@ -101,12 +200,26 @@ def test_markup_auto_foreground():
         result := zml("[invert yellow]Test")
     ) == "\x1b[38;2;255;255;0;48;2;35;35;35;7mTest", repr(result)
 
+    assert (
+        result := zml("[invert yellow]Test[/invert]Plain")
+    ) == "\x1b[38;2;255;255;0;48;2;35;35;35;7mTest\x1b[27;49mPlain", repr(result)
+
     assert (
         (result := zml("[@yellow]Black[@black]White"))
         == "\x1b[38;2;35;35;35;48;2;255;255;0mBlack\x1b[38;2;245;245;245;48;2;0;0;0mWhite"
     ), repr(result)
 
 
+def test_markup_auto_foreground_is_per_span():
+    # The contrast color only belongs to the span it was computed for, so unsetting
+    # the color it contrasts with shouldn't leave it behind.
+    _, plain = zml_get_spans("[@red]Auto[/bg]Plain")
+    assert plain.foreground is None and plain.background is None, repr(plain)
+
+    _, plain = zml_get_spans("[invert yellow]Auto[/fg]Plain")
+    assert plain.foreground is None and plain.background is None, repr(plain)
+
+
 def test_markup_colors():
     assert parse_color("red", False) == "38;2;255;0;0"
     assert parse_color("blue", True) == "48;2;0;0;255"
@@ -141,6 +254,12 @@ def test_markup_parse_errors():
     with pytest.raises(ZmlSemanticsError):
         zml("Test[/!not-a-macro]")
 
+    assert str(ZmlNameError("tag")) == "Unknown tag 'tag'."
+    assert (
+        str(ZmlSemanticsError("!macro", "Not set.", expected_type="macro"))
+        == "Invalid macro '!macro': Not set."
+    )
+
 
 def test_markup_downgrade_colors():
     Color.terminal = terminal
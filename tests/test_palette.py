@@ -1,3 +1,5 @@
+import pytest
+
 from slate.color import Color
 from zenith.markup import zml_context
 from zenith.palette import Palette, analogous, tetradic, triadic
@@ -68,3 +70,26 @@ def test_palette_namespacing():
 
     pal.unalias()
     assert ctx["aliases"] == {}
+
+
+def test_palette_attributes():
+    pal = Palette("#42DFBC")
+
+    assert pal.primary is pal.primary
+
+    pal.update(primary=Color.from_hex("#123456"))
+    assert pal.primary == Color.from_hex("#123456")
+
+    with pytest.raises(AttributeError):
+        pal.not_a_color  # pylint: disable=pointless-statement
+
+
+def test_palette_shade_range():
+    with pytest.raises(ValueError):
+        Palette("#42DFBC", shade_count=11)
+
+    with pytest.raises(ValueError):
+        Palette("#42DFBC", shade_step=0.4)
+
+    with pytest.raises(ValueError):
+        Palette("#42DFBC", shade_step=-0.1)
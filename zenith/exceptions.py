@@ -9,15 +9,15 @@ __all__ = [
 ]
 
 
-def _generate_error_text(start: str, expected_type: str, tag: str, context: str) -> str:
+def _generate_error_text(
+    start: str, expected_type: str, tag: str, context: str | None
+) -> str:
     """Generates a generic error message."""
 
-    buff = f"{start} {expected_type} {tag!r}"
-
     if context is None:
-        return buff + "."
+        return f"{start} {expected_type} {tag!r}."
 
-    return buff + f": {context}"
+    return f"{start} {expected_type} {tag!r}: {context}"
 
 
 class ZmlError(BaseException):
@@ -34,7 +34,7 @@ class ZmlNameError(ZmlError):
 
     def __str__(self) -> str:
         return _generate_error_text(
-            "Unknown", self.expected_type, self.tag, self.context or ""
+            "Unknown", self.expected_type, self.tag, self.context
         )
 
 
@@ -48,5 +48,5 @@ class ZmlSemanticsError(ZmlError):
 
     def __str__(self) -> str:
         return _generate_error_text(
-            "Invalid", self.expected_type, self.tag, self.context or ""
+            "Invalid", self.expected_type, self.tag, self.context
         )
@@ -0,0 +1,78 @@
+"""A small least-recently-used cache mapping."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+__all__ = ["LRUCache"]
+
+KT = TypeVar("KT", bound=Hashable)
+VT = TypeVar("VT")
+
+_MISSING = object()
+"""A sentinel to detect missing keys without raising KeyError."""
+
+
+class LRUCache(Generic[KT, VT]):
+    """A mapping that only keeps its `maxsize` most recently used items.
+
+    Both lookups and assignments count as a 'use'. Once the cache is full, setting a
+    new key will evict the least recently used one.
+    """
+
+    def __init__(self, maxsize: int = 512) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize!r}.")
+
+        self._maxsize = maxsize
+        self._data: OrderedDict[KT, VT] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key: KT) -> VT:
+        value = self._data[key]
+        self._data.move_to_end(key)
+
+        return value
+
+    def __setitem__(self, key: KT, value: VT) -> None:
+        data = self._data
+
+        if key in data:
+            data.move_to_end(key)
+            data[key] = value
+            return
+
+        data[key] = value
+
+        if len(data) > self._maxsize:
+            data.popitem(last=False)
+
+    @property
+    def maxsize(self) -> int:
+        """Returns the maximum amount of items this cache can hold."""
+
+        return self._maxsize
+
+    def get(self, key: KT, default: VT | None = None) -> VT | None:
+        """Returns the value for `key` if it's cached, `default` otherwise."""
+
+        data = self._data
+        value = data.get(key, _MISSING)
+
+        if value is _MISSING:
+            return default
+
+        data.move_to_end(key)
+
+        return value  # type: ignore
+
+    def clear(self) -> None:
+        """Removes all items from the cache."""
+
+        self._data.clear()
@@ -1,33 +1,54 @@
 from functools import lru_cache
 from time import strftime
-from typing import Callable, Literal
+from typing import Callable, Literal, Tuple
 
 from slate.color import Color
 
-from .markup import parse_color, zml_macro, zml_pre_process
+from .markup import GLOBAL_CONTEXT, parse_color, zml_macro, zml_pre_process
 
 
 def transform(text: str, transformer: Callable[[int, str], str]) -> str:
     """Applies the given transformation for all non-style chars, returns the result."""
 
+    # Without any tags to skip, the whole loop can run inside `map`
+    if "[" not in text and "]" not in text:
+        return "".join(map(transformer, range(len(text)), text))
+
     i = 0
-    output = ""
+    output: list[str] = []
+    append = output.append
     in_group = False
 
     for char in text:
         if char in "[]":
-            output += char
+            append(char)
             in_group = char == "["
             continue
 
         if in_group:
-            output += char
+            append(char)
             continue
 
-        output += transformer(i, char)
+        append(transformer(i, char))
         i += 1
 
-    return output
+    return "".join(output)
+
+
+@lru_cache(512)
+def _resolve_color_token(token: str, _version: int) -> Tuple[bool, str]:
+    """Resolves a (possibly aliased) color tag into its layer and ANSI body.
+
+    Args:
+        token: The color tag to resolve.
+        _version: The global context's version. Its only use is to key the cache, so
+            results are recalculated when the global aliases change.
+    """
+
+    token = zml_pre_process(f"[{token}]")[1:-1]
+    is_background = token.startswith("@")
+
+    return is_background, parse_color(token[is_background:], is_background)
 
 
 @zml_macro
@@ -70,9 +91,8 @@ def gradient(
         method: The type of gradient to apply.
     """
 
-    is_background = origin.startswith("@")
-    origin = zml_pre_process(f"[{origin}]")[1:-1]
-    color = Color.from_ansi(parse_color(origin.lstrip("@"), is_background))
+    is_background, ansi = _resolve_color_token(origin, GLOBAL_CONTEXT["version"])
+    color = Color.from_ansi(ansi)
 
     if method == "shade":
         steps = [
@@ -93,19 +113,29 @@ def gradient(
         ]
 
     else:
-        raise ValueError(r"Unknown gradient method {method!r}.")
+        raise ValueError(f"Unknown gradient method {method!r}.")
 
     blocksize = max(round(len(text) / 5), 1)
+    prefixes = [f"[{'@' * step.is_background}{step.hex}]" for step in steps]
+    closer = f"[{'/bg' if is_background else '/fg'}]"
 
-    def _transform(i: int, char: str) -> str:
-        if len(steps) > 0 and i % blocksize == 0:
-            color = steps.pop(0)
+    # Without any tags in the way, we can slice the text into its blocks directly
+    if "[" not in text and "]" not in text:
+        blocks = [text[i * blocksize : (i + 1) * blocksize] for i in range(4)]
+        blocks.append(text[4 * blocksize :])
 
-            return f"[{'@' * color.is_background}{color.hex}]{char}"
+        return (
+            "".join(prefix + block for prefix, block in zip(prefixes, blocks) if block)
+            + closer
+        )
+
+    def _transform(i: int, char: str) -> str:
+        if len(prefixes) > 0 and i % blocksize == 0:
+            return prefixes.pop(0) + char
 
         return char
 
-    return transform(text, _transform) + f"[{'/bg' if is_background else '/fg'}]"
+    return transform(text, _transform) + closer
 
 
 @zml_macro
@@ -115,10 +145,8 @@ def alpha(text: str, color: str, opacity: str) -> str:
     if opacity == "1.0":
         return zml_pre_process(f"[{color}]{text}")
 
-    color = zml_pre_process(f"[{color}]")[1:-1]
-    background = color.startswith("@")
+    background, ansi = _resolve_color_token(color, GLOBAL_CONTEXT["version"])
 
-    color = ";".join(parse_color(color.lstrip("@"), background).split(";")[2:])
-    color += f";{opacity}"
+    red, green, blue = Color.from_ansi(ansi).rgb
 
-    return f"[{'@' * background}{color}]{text}"
+    return f"[{'@' * background}{red};{green};{blue};{opacity}]{text}"
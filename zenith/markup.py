@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import re
 from functools import lru_cache
-from typing import Callable, Literal, TypedDict
+from itertools import count
+from typing import Any, Callable, Mapping, TypedDict
 
 from slate.color import Color
 from slate.color_info import NAMED_COLORS
@@ -11,11 +12,13 @@ from slate.terminal import terminal
 from slate.core import ColorSpace, width as text_width
 
 from .exceptions import ZmlNameError, ZmlSemanticsError
+from .lru_cache import LRUCache
 
 __all__ = [
     "zml",
     "zml_wrap",
     "zml_alias",
+    "zml_unalias",
     "zml_escape",
     "preserve_escapes",
     "restore_preserved_escapes",
@@ -25,6 +28,7 @@ __all__ = [
     "zml_expand_aliases",
     "zml_pre_process",
     "zml_context",
+    "zml_refresh",
     "MarkupContext",
     "MacroType",
     "GLOBAL_CONTEXT",
@@ -40,6 +44,9 @@ RE_COLOR = re.compile(
     r"(?:^@?([\d]{1,3})$)|(?:@?#?([0-9a-fA-F]{6}))|(@?\d{1,3};\d{1,3};\d{1,3})"
 )
 
+_COLOR_FIRST_CHARS = frozenset("#0123456789abcdefABCDEF")
+"""The characters a (non-named) color tag can start with, once `@` is removed."""
+
 DEFAULT_PRESERVERS = (
     "\0{%\0",
     "\0%}\0",
@@ -47,10 +54,30 @@ DEFAULT_PRESERVERS = (
 
 
 class MarkupContext(TypedDict):
-    """A ctx mapping that stores alias & macro information."""
+    """A ctx mapping that stores alias & macro information.
+
+    The `version` key is updated every time the context is modified through
+    `zml_alias`, `zml_unalias` or a macro setter, and is used to key `zml`'s cache.
+    Editing `aliases` or `macros` directly won't update it, so call `zml_refresh`
+    afterwards.
+    """
 
     aliases: dict[str, str]
     macros: dict[str, MacroType]
+    version: int
+
+
+_CONTEXT_VERSIONS = count()
+"""Generates versions for contexts, unique across all contexts."""
+
+_ZML_CACHE: LRUCache[tuple[str, str, int], str] = LRUCache(1024)
+"""Caches zml outputs by their markup, prefix and context version."""
+
+_PRE_PROCESS_CACHE: LRUCache[tuple[str, str, int], str] = LRUCache(1024)
+"""Caches pre-processed markup by its source, prefix and context version."""
+
+_COMBINED_CACHE: LRUCache[str, str] = LRUCache(1024)
+"""Caches the combined spans of pre-processed markup, by the markup itself."""
 
 
 # TODO: Maybe this could also implement all word boundaries except for just " "?
@@ -64,30 +91,52 @@ def zml_wrap(text: str, width: int) -> list[str]:
     in_tag = False
 
     for line in text.splitlines():
-        current = ""
+        parts: list[str] = []
         length = 0
+        position = 0
+
+        # Walk the line in runs of tags & plain text, instead of char-by-char
+        while position < len(line):
+            if in_tag:
+                end = line.find("]", position)
 
-        for char in line:
-            if char == "[":
-                in_tag = True
+                if end == -1:
+                    parts.append(line[position:])
+                    break
 
-            elif char == "]":
+                parts.append(line[position : end + 1])
+                position = end + 1
                 in_tag = False
+                continue
 
-            current += char
+            end = line.find("[", position)
 
-            if in_tag:
-                continue
+            if end == -1:
+                end = len(line)
+
+            plain = line[position:end]
+
+            # Break the line every time the run reaches the width
+            while length < width <= length + len(plain):
+                cutoff = width - length
 
-            length += 1
+                parts.append(plain[:cutoff])
+                plain = plain[cutoff:]
 
-            if length == width:
-                *current, rest = current.split(" ")
-                lines.append(" ".join(current))
+                *words, rest = "".join(parts).split(" ")
+                lines.append(" ".join(words))
 
-                current = rest
+                parts = [rest]
                 length = text_width(rest)
 
+            parts.append(plain)
+            length += len(plain)
+
+            position = end
+            in_tag = end < len(line)
+
+        current = "".join(parts)
+
         if current != "":
             lines.append(current)
 
@@ -95,9 +144,24 @@ def zml_wrap(text: str, width: int) -> list[str]:
 
 
 def zml_context() -> MarkupContext:
-    """Generates an empty MarkupContext object."""
+    """Generates an empty MarkupContext object.
+
+    Its aliases & macros should be changed through `zml_alias`, `zml_unalias` and
+    `zml_macro_setter`. If they are edited directly, call `zml_refresh` afterwards.
+    """
+
+    return {"aliases": {}, "macros": {}, "version": next(_CONTEXT_VERSIONS)}
+
+
+def zml_refresh(ctx: MarkupContext | None = None) -> None:
+    """Marks the given context as modified, invalidating `zml`'s cache for it.
+
+    This is done automatically by `zml_alias`, `zml_unalias` and macro setters, so it
+    only needs to be called after editing a context's aliases or macros directly.
+    """
 
-    return {"aliases": {}, "macros": {}}
+    ctx = ctx or GLOBAL_CONTEXT
+    ctx["version"] = next(_CONTEXT_VERSIONS)
 
 
 GLOBAL_CONTEXT = zml_context()
@@ -110,6 +174,7 @@ def zml_macro_setter(*, ctx: MarkupContext) -> Callable[[MacroType], MacroType]:
         name = macro.__name__.replace("_", "-")
 
         ctx["macros"][f"!{name}"] = macro
+        zml_refresh(ctx)
 
         return macro
 
@@ -127,28 +192,65 @@ def _find_unsetter(tag: str) -> str:
         return tag
 
     key = tag
+    color = tag[1:] if tag.startswith("@") else tag
 
-    if RE_COLOR.match(tag) or tag in NAMED_COLORS:
+    if color in NAMED_COLORS or (
+        color[:1] in _COLOR_FIRST_CHARS and RE_COLOR.match(color)
+    ):
         key = "bg" if tag.startswith("@") else "fg"
 
     return f"/{key}"
 
 
 def zml_alias(
-    *, ctx: MarkupContext | None = None, assign_unsetter: bool = True, **pairs: str
+    mapping: Mapping[str, str] | None = None,
+    /,
+    *,
+    ctx: MarkupContext | None = None,
+    assign_unsetter: bool = True,
+    **pairs: str,
 ) -> None:
-    """Aliases each item of the given pairs."""
+    """Aliases each item of the given mapping and pairs.
+
+    The mapping can be used for keys that aren't valid identifiers, or to avoid
+    unpacking large dictionaries into keyword arguments.
+    """
 
-    if assign_unsetter:
-        for key, value in pairs.copy().items():
-            pairs[f"/{key}"] = " ".join(_find_unsetter(part) for part in value.split())
+    ctx = ctx or GLOBAL_CONTEXT
+
+    aliases = ctx["aliases"]
+
+    for source in (mapping or {}, pairs):
+        for key, value in source.items():
+            key = key.replace("_", "-")
+            aliases[key] = value
+
+            if assign_unsetter:
+                aliases[f"/{key}"] = " ".join(
+                    _find_unsetter(part) for part in value.split()
+                )
+
+    zml_refresh(ctx)
+
+
+def zml_unalias(
+    *keys: str, ctx: MarkupContext | None = None, remove_unsetter: bool = True
+) -> None:
+    """Removes each of the given aliases."""
 
     ctx = ctx or GLOBAL_CONTEXT
 
     aliases = ctx["aliases"]
 
-    for key, value in pairs.items():
-        aliases[key.replace("_", "-")] = value
+    for key in keys:
+        key = key.replace("_", "-")
+
+        del aliases[key]
+
+        if remove_unsetter:
+            del aliases[f"/{key}"]
+
+    zml_refresh(ctx)
 
 
 class StyleMap(TypedDict):
@@ -169,27 +271,58 @@ class StyleMap(TypedDict):
     hyperlink: str
 
 
+_EMPTY_STYLE_MAP: StyleMap = {
+    "bold": False,
+    "dim": False,
+    "italic": False,
+    "underline": False,
+    "blink": False,
+    "fast_blink": False,
+    "invert": False,
+    "conceal": False,
+    "strike": False,
+    "foreground": None,
+    "background": None,
+    "hyperlink": "",
+}
+"""The template `_get_style_map` copies from. Never mutate this!"""
+
+
 def _get_style_map() -> StyleMap:
     """Generates an empty StyleMap object."""
 
-    return {
-        "bold": False,
-        "dim": False,
-        "italic": False,
-        "underline": False,
-        "blink": False,
-        "fast_blink": False,
-        "invert": False,
-        "conceal": False,
-        "strike": False,
-        "foreground": None,
-        "background": None,
-        "hyperlink": "",
-    }
-
-
-def _apply_auto_foreground(styles: StyleMap) -> bool:
-    """Determines whether automatic foreground can be applied to the style map."""
+    return _EMPTY_STYLE_MAP.copy()
+
+
+_STYLE_KEYS = frozenset(_EMPTY_STYLE_MAP)
+"""The keys of a StyleMap, any of which can be used as a tag."""
+
+_SPAN_STYLE_KEYS = tuple(_EMPTY_STYLE_MAP)
+"""The style attributes of a Span, in the order they are compared in."""
+
+_UNSETTERS = {**UNSETTERS, "fast_blink": "25", "conceal": "28", "strike": "29"}
+"""Slate's unsetters, extended to cover every StyleMap key."""
+
+
+@lru_cache(8)
+def _get_contrast_color(rgb: tuple[int, int, int], is_background: bool) -> Color:
+    """Returns a shared contrast color instance for the given layer.
+
+    Contrast colors are always either off-white or off-black, so this only ever holds
+    4 instances.
+    """
+
+    return Color(rgb, is_background=is_background)
+
+
+def _get_auto_foreground(styles: StyleMap) -> tuple[str, Color] | None:
+    """Gets the automatic foreground that should be applied to the style map, if any.
+
+    Returns:
+        The key the contrast color belongs to (background if the styles are inverted,
+        foreground otherwise) and the color itself, or None if there is nothing to
+        apply. The style map itself is left untouched.
+    """
 
     foreground = styles["foreground"]
     background = styles["background"]
@@ -199,24 +332,22 @@ def _apply_auto_foreground(styles: StyleMap) -> bool:
         foreground, background = background, foreground
 
     if foreground is None and background is not None:
-        new = background.contrast.as_background(invert)
-
-        if invert:
-            styles["background"] = new
-        else:
-            styles["foreground"] = new
+        new = _get_contrast_color(background.contrast.rgb, invert)
 
-        return True
+        return ("background" if invert else "foreground"), new
 
-    return False
+    return None
 
 
+@lru_cache(1024)
 def parse_color(color: str, background: bool | int) -> str:
     """Parses a color tag."""
 
-    background *= 10
+    background = 10 if background else 0
 
-    color = color.lstrip("@")
+    # Callers within the module pass the tag's body, but we still accept `@` tags
+    if color[:1] == "@":
+        color = color[1:]
 
     if color.isdigit():
         index = int(color)
@@ -241,61 +372,82 @@ def parse_color(color: str, background: bool | int) -> str:
     if color.startswith("#"):
         color = color.lstrip("#")
 
+        red, green, blue = bytes.fromhex(color[:6])
         alpha = color[6:]
 
-        color = ";".join(
-            str(int(part, base=16)) for part in [color[:2], color[2:4], color[4:6]]
-        )
-
         if alpha != "":
-            color += f";{int(alpha, base=16) / 255}"
+            return f"{38 + background};2;{red};{green};{blue};{int(alpha, 16) / 255}"
+
+        return f"{38 + background};2;{red};{green};{blue}"
 
     return f"{38 + background};2;{color}"
 
 
-def _apply_tag(tag: str, styles: StyleMap) -> None:
-    """Applies the given tag to the style map.
+@lru_cache(1024)
+def _color_from_ansi(ansi: str) -> Color:
+    """Returns a shared Color instance for the given ANSI sequence body.
+
+    The returned instances are cached, so this cache has to be cleared whenever the
+    terminal's color space changes (see `_on_color_space_set`).
+    """
+
+    return Color.from_ansi(ansi)
+
+
+@lru_cache(1024)
+def _split_tags(tags: str) -> tuple[str, ...]:
+    """Splits the given tag string (a tag group or alias value) into its tags.
+
+    The same groups & aliases tend to show up over and over, so this saves
+    re-splitting them on every use.
+    """
+
+    return tuple(tags.split())
+
 
-    Note that this mutates the given map!
+@lru_cache(1024)
+def _parse_tag(  # pylint: disable=too-many-return-statements
+    tag: str,
+) -> tuple[tuple[str, Any], ...]:
+    """Parses the given tag into the style map updates it represents.
+
+    The results are cached, so this cache has to be cleared whenever the terminal's
+    color space changes (see `_on_color_space_set`).
     """
 
     if tag == "/":
-        styles.update(**_get_style_map())  # type: ignore
-        return
+        return tuple(_EMPTY_STYLE_MAP.items())
 
     is_unsetter = tag.startswith("/")
     is_background = tag.startswith("@")
 
-    tag = tag.lstrip("/").lstrip("@")
+    offset = int(is_unsetter)
+    if tag[offset : offset + 1] == "@":
+        offset += 1
 
-    if tag in styles or tag in ["fg", "bg"]:
-        if tag == "fg":
-            styles["foreground"] = None
+    tag = tag[offset:]
 
-        elif tag == "bg":
-            styles["background"] = None
+    if tag == "fg":
+        return (("foreground", None),)
 
-        else:
-            styles[tag] = not is_unsetter  # type: ignore
+    if tag == "bg":
+        return (("background", None),)
 
-        return
+    if tag in _STYLE_KEYS:
+        return ((tag, not is_unsetter),)
 
-    layer: Literal["background", "foreground"] = (
-        "background" if is_background else "foreground"
-    )
+    layer = "background" if is_background else "foreground"
 
-    if RE_COLOR.match(tag):
-        styles[layer] = Color.from_ansi(parse_color(tag, is_background))
-        return
+    if tag[:1] in _COLOR_FIRST_CHARS and RE_COLOR.match(tag):
+        return ((layer, _color_from_ansi(parse_color(tag, is_background))),)
 
     if tag in NAMED_COLORS:
-        styles[layer] = Color.from_hex(NAMED_COLORS[tag]).as_background(is_background)
-
-        return
+        return (
+            (layer, Color.from_hex(NAMED_COLORS[tag]).as_background(is_background)),
+        )
 
     if tag.startswith("~"):
-        styles["hyperlink"] = "" if is_unsetter else tag[1:]
-        return
+        return (("hyperlink", "" if is_unsetter else tag[1:]),)
 
     raise ZmlNameError(tag,
         context=(
@@ -334,29 +486,43 @@ def _apply_prefix(tag: str, prefix: str) -> str:
     return prefix + tag
 
 
-@lru_cache(512)
 def combine_spans(spans: tuple[Span, ...]) -> str:
     """Combines the given span iterable into optimized ANSI text."""
 
     styles = _get_style_map()
 
-    buff = ""
+    parts: list[str] = []
+    append = parts.append
+    get_unsetter = _UNSETTERS.__getitem__
     span: Span | None = None
 
+    # Whether `styles` is currently unstyled. After every span, `styles` matches the
+    # span's own attributes.
+    is_plain = True
+
     for span in spans:
         if span is FULL_RESET:
-            buff += "\x1b[0m"
+            append("\x1b[0m")
             styles = _get_style_map()
+            is_plain = True
             continue
 
+        # A span with no styles renders as its own text
+        span_is_plain = str(span) == span.text
+
+        if is_plain and span_is_plain:
+            append(span.text)
+            continue
+
+        is_plain = span_is_plain
+
         new = {}
         unset = []
 
-        for key, value in span.attrs.items():
-            if key in ["text", "reset_after"]:
-                continue
+        for key in _SPAN_STYLE_KEYS:
+            value = getattr(span, key)
 
-            if key == "hyperlink" and value not in ["", styles[key]]:  # type: ignore
+            if key == "hyperlink" and value not in ("", styles[key]):  # type: ignore
                 new[key] = value
                 continue
 
@@ -366,28 +532,48 @@ def combine_spans(spans: tuple[Span, ...]) -> str:
                 if not value and key != "hyperlink":
                     unset.append(key)
 
-        if len(unset) > 0:
-            # TODO: Maybe this could insert into the span's sequences?
-            buff += "\x1b["
+        text = span.text
+        rendered = str(Span(**new, text=text, reset_after=False))
+        styles.update(**new)  # type: ignore
 
-            for key in unset:
-                buff += UNSETTERS[key] + ";"
+        if len(unset) == 0:
+            append(rendered)
+            continue
 
-            buff = buff.rstrip(";") + "m"
+        unsetters = ";".join(map(get_unsetter, unset))
 
-        buff += str(Span(**new, text=span.text, reset_after=False))  # type: ignore
-        styles.update(**new)  # type: ignore
+        # Insert the unsetters into the span's own sequence when it has one, so we only
+        # emit a single SGR sequence. Hyperlinks wrap that sequence, so they can't.
+        if not new.get("hyperlink") and len(rendered) > len(text):
+            append(f"\x1b[{unsetters};{rendered[2:]}")
+            continue
+
+        append(f"\x1b[{unsetters}m{rendered}")
 
-    return buff
+    return "".join(parts)
 
 
 @lru_cache(512)
-def zml_get_spans(text: str, keep_preservers: bool = False) -> tuple[Span, ...]:
+def zml_get_spans(  # pylint: disable=too-many-locals
+    text: str, keep_preservers: bool = False
+) -> tuple[Span, ...]:
     """Gets all spans from the given ZML text."""
 
     styles: StyleMap = _get_style_map()
     spans: list[Span] = []
 
+    # Adjacent parts that share the same styles are merged into one span, so they are
+    # only flushed once the styles change.
+    parts: list[str] = []
+    last_config: Mapping[str, Any] | None = None
+
+    # Bind these locally, as they are looked up for every tag & span
+    append = spans.append
+    update_styles = styles.update
+    parse_tag = _parse_tag
+    split_tags = _split_tags
+    get_auto_foreground = _get_auto_foreground
+
     for mtch in RE_MARKUP.finditer(text):
         tags, plain = mtch.groups()
 
@@ -398,30 +584,71 @@ def zml_get_spans(text: str, keep_preservers: bool = False) -> tuple[Span, ...]:
         tags = tags or ""
         plain = plain or ""
 
-        for tag in tags.split():
+        for tag in split_tags(tags):
             if tag == "/":
-                spans.append(FULL_RESET)
+                if last_config is not None:
+                    append(Span("".join(parts), **last_config))
+                    parts, last_config = [], None
+
+                # Resetting twice in a row has no further effect
+                if not spans or spans[-1] is not FULL_RESET:
+                    append(FULL_RESET)
 
-            _apply_tag(tag, styles)
+            update_styles(parse_tag(tag))  # type: ignore
 
         if plain == "":
             continue
 
-        auto_fg = _apply_auto_foreground(styles)
-
         if not keep_preservers:
             plain = restore_preserved_escapes(plain)
 
-        spans.append(Span(plain, **styles))
+        auto_fg = get_auto_foreground(styles)
+        config: Mapping[str, Any] = styles
+
+        if auto_fg is not None:
+            key, color = auto_fg
+            config = {**styles, key: color}
+
+        if config == last_config:
+            parts.append(plain)
+            continue
+
+        if last_config is not None:
+            append(Span("".join(parts), **last_config))
+
+        # The style map keeps changing, so a new run needs its own snapshot of it
+        parts, last_config = [plain], (styles.copy() if config is styles else config)
 
-        if auto_fg:
-            styles["foreground"] = None
+    if last_config is not None:
+        append(Span("".join(parts), **last_config))
 
     return (*spans,)
 
 
+def clear_caches() -> None:
+    """Clears every cache used while parsing markup.
+
+    This happens automatically when the terminal's color space changes; calling it by
+    hand is mostly useful for timing uncached parsing.
+    """
+
+    for cached in (
+        zml_get_spans,
+        parse_color,
+        _color_from_ansi,
+        _split_tags,
+        _parse_tag,
+        _get_contrast_color,
+    ):
+        cached.cache_clear()
+
+    _ZML_CACHE.clear()
+    _PRE_PROCESS_CACHE.clear()
+    _COMBINED_CACHE.clear()
+
+
 def _on_color_space_set(_: ColorSpace | None) -> bool:
-    zml_get_spans.cache_clear()
+    clear_caches()
 
     return True
 
@@ -435,7 +662,7 @@ def zml_expand_aliases(
 
     ctx = ctx or GLOBAL_CONTEXT
 
-    aliased = ""
+    aliased: list[str] = []
 
     for mtch in RE_MARKUP.finditer(text):
         tags, plain = mtch.groups()
@@ -444,11 +671,11 @@ def zml_expand_aliases(
             continue
 
         if tags is not None:
-            aliased += "["
+            group: list[str] = []
 
-            for tag in tags.split():
+            for tag in _split_tags(tags):
                 if "*" in tag:
-                    aliased += f"!alpha({','.join(tag.split('*'))}) "
+                    group.append(f"!alpha({','.join(tag.split('*'))})")
                     continue
 
                 prefixed = _apply_prefix(tag, prefix)
@@ -456,36 +683,43 @@ def zml_expand_aliases(
                 if prefixed in ctx["aliases"]:
                     tag = ctx["aliases"][prefixed]
 
-                aliased += tag + " "
+                group.append(tag)
 
-            aliased = aliased.rstrip(" ") + "]"
+            aliased.append(f"[{' '.join(group)}]")
 
         if plain is not None:
-            aliased += plain
+            aliased.append(plain)
 
-    return aliased
+    return "".join(aliased)
 
 
-def zml_pre_process(  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
-    text: str, prefix: str = "", ctx: MarkupContext | None = None
-) -> str:
-    """Applies pre-processing to the given ZML text.
+def _pre_process(  # pylint: disable=too-many-locals, too-many-branches, too-many-statements
+    text: str, prefix: str, ctx: MarkupContext | None
+) -> tuple[str, bool]:
+    """Implements `zml_pre_process`.
 
-    Currently, this involves three steps:
-
-    - Substitute all aliases with their real values
-    - Evaluate macros on the plain text
-    - Eliminate groups that don't contain a plain part
+    Returns:
+        The pre-processed text, and whether any macros were evaluated during it.
     """
 
-    text = zml_expand_aliases(text, prefix, ctx)
-
     ctx = ctx or GLOBAL_CONTEXT
 
+    version = ctx.get("version")
+    key = (text, prefix, version)
+
+    if version is not None:
+        cached = _PRE_PROCESS_CACHE.get(key)
+
+        if cached is not None:
+            return cached, False
+
     macros: dict[str, tuple[MacroType, list[str]]] = {}
+    aliases = ctx["aliases"]
     get_macro = ctx["macros"].get
 
-    output = ""
+    uses_macros = False
+
+    output: list[str] = []
     for mtch in RE_MARKUP.finditer(text):
         tags, plain = mtch.groups()
 
@@ -496,14 +730,33 @@ def zml_pre_process(  # pylint: disable=too-many-locals, too-many-branches, too-
         tags = tags or ""
         plain = plain or ""
 
-        tag_list = tags.split()
+        # Expand aliases in the same pass, like `zml_expand_aliases` would
+        tag_list: list[str] = []
+
+        for tag in _split_tags(tags):
+            if "*" in tag:
+                tag_list.append(f"!alpha({','.join(tag.split('*'))})")
+                continue
+
+            prefixed = _apply_prefix(tag, prefix)
+
+            if prefixed in aliases:
+                tag_list.extend(_split_tags(aliases[prefixed]))
+                continue
+
+            tag_list.append(tag)
+
+        # The tags left over once macros are taken out
+        remaining: list[str] = []
 
-        for tag in tag_list.copy():
+        for tag in tag_list:
             if tag == "/":
                 macros.clear()
+                remaining.append(tag)
                 continue
 
             if not tag.startswith(("!", "/!")):
+                remaining.append(tag)
                 continue
 
             if tag.startswith("/!"):
@@ -528,18 +781,37 @@ def zml_pre_process(  # pylint: disable=too-many-locals, too-many-branches, too-
 
                 macros[name] = (macro, args)
 
-            tag_list.remove(tag)
-
-        if len(tag_list) > 0:
-            output += f"[{' '.join(tag_list)}]"
+        if len(remaining) > 0:
+            output.append(f"[{' '.join(remaining)}]")
 
         if plain is not None:
             for macro, args in macros.values():
                 plain = macro(plain, *args)
+                uses_macros = True
+
+            output.append(plain)
 
-            output += plain
+    result = "".join(output).replace("][", " ")
 
-    return output.replace("][", " ")
+    if version is not None and not uses_macros:
+        _PRE_PROCESS_CACHE[key] = result
+
+    return result, uses_macros
+
+
+def zml_pre_process(
+    text: str, prefix: str = "", ctx: MarkupContext | None = None
+) -> str:
+    """Applies pre-processing to the given ZML text.
+
+    Currently, this involves three steps:
+
+    - Substitute all aliases with their real values
+    - Evaluate macros on the plain text
+    - Eliminate groups that don't contain a plain part
+    """
+
+    return _pre_process(text, prefix, ctx)[0]
 
 
 def zml_escape(text: str) -> str:
@@ -551,12 +823,20 @@ def zml_escape(text: str) -> str:
 def preserve_escapes(text: str, preservers: tuple[str, str] = DEFAULT_PRESERVERS) -> str:
     """Escapes ZML-syntax characters with the given replacements."""
 
+    # Most text has no escapes, which we can tell from a single scan
+    if "\\" not in text:
+        return text
+
     return text.replace(r"\[", preservers[0]).replace(r"\]", preservers[1])
 
 
 def restore_preserved_escapes(text: str, preservers: tuple[str, str] = DEFAULT_PRESERVERS) -> str:
     """Escapes ZML-syntax characters with the given preservers."""
 
+    # Both default preservers contain a null byte, so one scan tells us if either is
+    if preservers is DEFAULT_PRESERVERS and "\0" not in text:
+        return text
+
     return text.replace(preservers[0], "[").replace(preservers[1], "]")
 
 
@@ -568,11 +848,48 @@ def zml(
     """Parses ZML markup into optimized ANSI text.
 
     DOCUMENT THIS
+
+    Outputs are cached by the context's version, so if its aliases or macros are
+    edited directly (instead of through `zml_alias`, `zml_unalias` or a macro setter),
+    call `zml_refresh` before rendering again.
     """
 
+    # Without any brackets there are no tags or escapes, so the text renders as-is
+    if "[" not in markup and "]" not in markup:
+        return markup
+
+    ctx = ctx or GLOBAL_CONTEXT
+
+    # Contexts not created by `zml_context` might not be versioned, so we can't cache
+    version = ctx.get("version")
+    key = (markup, prefix, version)
+
+    if version is not None:
+        cached = _ZML_CACHE.get(key)
+
+        if cached is not None:
+            return cached
+
     markup = preserve_escapes(markup)
 
-    # TODO: This step should be cached/done smarter. It takes ages!
-    markup = zml_pre_process(markup, prefix=prefix, ctx=ctx)
+    # Without aliases, macros or alpha shorthands there is nothing to substitute. The
+    # tags are left unnormalized, which `zml_get_spans` handles the same way.
+    if not ctx["aliases"] and "!" not in markup and "*" not in markup:
+        uses_macros = False
+    else:
+        markup, uses_macros = _pre_process(markup, prefix, ctx)
+
+    # Keyed on the pre-processed text, as hashing the span tuple is far more expensive
+    combined = _COMBINED_CACHE.get(markup)
+
+    if combined is None:
+        combined = _COMBINED_CACHE[markup] = combine_spans(zml_get_spans(markup))
+
+    output = restore_preserved_escapes(combined)
+
+    # Macros may give a different output on every call (e.g. !time), so their results
+    # can't be cached.
+    if version is not None and not uses_macros:
+        _ZML_CACHE[key] = output
 
-    return restore_preserved_escapes(combine_spans(zml_get_spans(markup)))
+    return output
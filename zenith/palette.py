@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Callable, Tuple
 
 from slate.color import Color, color
 
-from .markup import GLOBAL_CONTEXT, MarkupContext, zml_alias
+from .markup import GLOBAL_CONTEXT, MarkupContext, zml_alias, zml_unalias
 
 __all__ = [
     "triadic",
@@ -19,6 +20,7 @@ __all__ = [
 PalettingFunction = Callable[[Color], Tuple[Color, Color, Color, Color]]
 
 
+@lru_cache(256)
 def triadic(base: Color) -> tuple[Color, Color, Color, Color]:
     r"""Returns a complementary triangle including base and the base's complement.
 
@@ -36,6 +38,7 @@ def triadic(base: Color) -> tuple[Color, Color, Color, Color]:
     return (*base.triadic_group, base.complement)
 
 
+@lru_cache(256)
 def analogous(base: Color) -> tuple[Color, Color, Color, Color]:
     """Returns three colors next to eachother, including base.
 
@@ -52,6 +55,7 @@ def analogous(base: Color) -> tuple[Color, Color, Color, Color]:
     return (*base.analogous_group, base.complement)
 
 
+@lru_cache(256)
 def tetradic(base: Color) -> tuple[Color, Color, Color, Color]:
     """Returns a complementary square including base.
 
@@ -68,6 +72,46 @@ def tetradic(base: Color) -> tuple[Color, Color, Color, Color]:
     return base.tetradic_group
 
 
+@lru_cache(256)
+def _get_shades(
+    rgb: tuple[int, int, int], shade_count: int, shade_step: float
+) -> tuple[str, ...]:
+    """Returns the hex codes of every shade of a color, from darkest to lightest.
+
+    This matches `Color.darken` & `Color.lighten` (which blend into black & white),
+    but computes every shade in a single pass without creating new Color instances.
+    As most palettes share some of their colors (text, semantic bases), the results
+    are cached by the color's RGB value.
+    """
+
+    red, green, blue = rgb
+    shades = []
+
+    for i in range(-shade_count, shade_count + 1):
+        if i == 0:
+            shades.append(f"#{red:02X}{green:02X}{blue:02X}")
+            continue
+
+        alpha = abs(i) * shade_step
+        target = 0 if i < 0 else 255
+
+        shade = (
+            int(red + (target - red) * alpha),
+            int(green + (target - green) * alpha),
+            int(blue + (target - blue) * alpha),
+        )
+
+        if any(not 0 <= val < 256 for val in shade):
+            raise ValueError(
+                "Color RGB values must be between 0 and 256,"
+                + f" got {shade!r} from shade {i} of {rgb!r}."
+            )
+
+        shades.append(f"#{shade[0]:02X}{shade[1]:02X}{shade[2]:02X}")
+
+    return tuple(shades)
+
+
 DEFAULT_PANEL = Color.black().blend_complement(0.2)
 PANEL_BLEND_ALPHA = 0.05
 
@@ -79,7 +123,7 @@ DEFAULT_WARNING = Color.from_hex("ebe267")
 SEMANTIC_BLEND_ALPHA = 0.3
 
 
-class Palette:
+class Palette:  # pylint: disable=too-many-instance-attributes
     """An object to represent a color palette.
 
     This object has 4 'main' colors, 1 'panel' color for each and 3
@@ -99,6 +143,18 @@ class Palette:
         green to display successful actions. Use sparingly!
     """
 
+    __slots__ = (
+        "_ctx",
+        "_mapping",
+        "_colors",
+        "_min_width",
+        "_shade_count",
+        "_shade_step",
+        "_namespace",
+        "_keys",
+        "_rendered",
+    )
+
     def __init__(  # pylint: disable=too-many-locals
         self,
         primary: Color | str | int,
@@ -125,6 +181,9 @@ class Palette:
     ) -> None:
         self._ctx: MarkupContext | None = None
         self._mapping: dict[str, str] = {}
+        self._colors: dict[str, Color] = {}
+        self._min_width = 0
+        self._rendered: str | None = None
 
         self._shade_count = shade_count
         self._shade_step = shade_step
@@ -166,10 +225,17 @@ class Palette:
         self.update(**self._keys)
 
     def __getattr__(self, attr: str) -> Color:
+        # Colors are frozen, so we can hand out the same instance on every access
+        color_ = self._colors.get(attr)
+
+        if color_ is not None:
+            return color_
+
         if attr not in self._mapping:
-            raise AttributeError
+            raise AttributeError(attr)
 
-        return Color.from_hex(self._mapping[attr])
+        color_ = self._colors[attr] = Color.from_hex(self._mapping[attr])
+        return color_
 
     def update(self, **mapping: Color) -> None:
         """Mutates the palette by some mapping.
@@ -182,22 +248,24 @@ class Palette:
         shade_step = self._shade_step
         namespace = self._namespace
 
-        for name, col in mapping.items():
-            for i in range(-shade_count, shade_count + 1):
-                if i == 0:
-                    key = name
-                    colorhex = col.hex
+        self._colors.clear()
+        self._rendered = None
 
-                elif i < 0:
-                    key = f"{name}{i}"
-                    colorhex = col.darken(-i, step_size=shade_step).hex
+        # The key suffix of each shade, e.g. `-3`, `` or `+1`
+        suffixes = [
+            "" if i == 0 else f"{i:+}" for i in range(-shade_count, shade_count + 1)
+        ]
+        palette_mapping = self._mapping
 
-                else:
-                    key = f"{name}+{i}"
-                    colorhex = col.lighten(i, step_size=shade_step).hex
+        for name, col in mapping.items():
+            shades = _get_shades(col.rgb, shade_count, shade_step)
+            prefix = namespace + name
 
-                self._mapping[f"{namespace}{key}"] = colorhex
-                self._mapping[f"@{namespace}{key}"] = f"@{colorhex}"
+            for suffix, colorhex in zip(suffixes, shades):
+                palette_mapping[prefix + suffix] = colorhex
+
+        # Used by `render` for its `@key` labels, this only changes when keys are added
+        self._min_width = max(map(len, self._mapping), default=0) + 3
 
     def alias(
         self, ctx: MarkupContext | None = None, ignore_already_aliased: bool = False
@@ -219,7 +287,12 @@ class Palette:
             )
 
         self._ctx = ctx or GLOBAL_CONTEXT
-        zml_alias(**self._mapping, ctx=ctx)  # type: ignore
+
+        # Background variants are derived here, so `_mapping` only stores each color once
+        aliases = self._mapping.copy()
+        aliases.update((f"@{key}", f"@{value}") for key, value in self._mapping.items())
+
+        zml_alias(aliases, ctx=ctx)
 
     def unalias(self) -> None:
         """Deletes aliases from the current context.
@@ -230,38 +303,42 @@ class Palette:
         if self._ctx is None:
             return
 
-        aliases = self._ctx["aliases"]
-
-        for key in self._mapping:
-            del aliases[key]
-            del aliases[f"/{key}"]
+        zml_unalias(
+            *self._mapping, *(f"@{key}" for key in self._mapping), ctx=self._ctx
+        )
 
         self._ctx = None
 
     def render(self) -> str:
         """Returns markup that shows off the palette.
 
-        Note that this is done according to the current `color_mapping`.
+        Note that this is done according to the current `color_mapping`. The result is
+        cached until the palette is next updated.
         """
 
-        min_width = max(len(key) for key in self._mapping) + 2
+        if self._rendered is not None:
+            return self._rendered
+
+        min_width = self._min_width
         offset_len = len(str(self._shade_count)) + 1
+        first_shade = str(-self._shade_count)
         lines = []
-        line = ""
+        line: list[str] = []
 
         for key, col in self._mapping.items():
-            if not key.startswith("@"):
-                continue
+            key = "@" + key
+            col = "@" + col
 
             sign, offset = [*key[-offset_len:]]
 
             if not (sign in ("-", "+") and offset.isdigit()):
-                line += f"[{col}]{key:^{min_width}}[/]"
+                line.append(f"[{col}]{key:^{min_width}}[/]")
 
-            if key[-offset_len:] == str(-self._shade_count):
-                lines.append(line)
-                line = ""
+            if key[-offset_len:] == first_shade:
+                lines.append("".join(line))
+                line = []
 
-            line += f"[{col}]{' ' * 3}[/]"
+            line.append(f"[{col}]   [/]")
 
-        return "\n".join(lines)
+        self._rendered = "\n".join(lines)
+        return self._rendered